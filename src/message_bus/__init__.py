@@ -1 +1,2 @@
 from message_bus.core import MessageBus, MessageBusABC, AsyncMessageBus  # noqa
+from message_bus.outbox_batcher import AsyncOutboxBatcher  # noqa
@@ -5,8 +5,11 @@ from typing import List
 
 
 class CommandHandlerABC(abc.ABC):
+    __slots__ = ("_emitted_messages", "_spare_emitted")
+
     def __init__(self):
         self._emitted_messages = []
+        self._spare_emitted = []
 
     @abc.abstractmethod
     def handle(self, cmd: commands.Command, context: dict, *args, **kwargs):
@@ -18,3 +21,15 @@ class CommandHandlerABC(abc.ABC):
     @property
     def emitted_messages(self) -> List[Message]:
         return self._emitted_messages
+
+    def drain_emitted(self) -> List[Message]:
+        # Double-buffer swap: the drained list is recycled on the next drain,
+        # so steady-state dispatch allocates no new lists. The returned list
+        # is only valid until then, which is fine for the bus that consumes
+        # it immediately.
+        emitted = self._emitted_messages
+        spare = self._spare_emitted
+        spare.clear()
+        self._emitted_messages = spare
+        self._spare_emitted = emitted
+        return emitted
@@ -2,4 +2,6 @@ from message_bus.types import Message
 
 
 class Command(Message):
-    pass
+    __slots__ = ()
+
+    kind = "command"
@@ -1,6 +1,9 @@
 import abc
 import logging
 import asyncio
+import inspect
+import itertools
+from collections import deque
 from typing_extensions import Optional
 import uuid
 
@@ -9,6 +12,7 @@ from typing import (
     List,
     Type,
     Dict,
+    Deque,
     Callable,
     Any,
     Tuple,
@@ -24,12 +28,128 @@ from message_bus.repositories.outbox import OutBoxRepoABC
 
 logger = logging.getLogger(__name__)
 
+_HANDLER_FAILED = object()
+
+
+def _logging_invoker(invoke: Callable) -> Callable:
+    def safe_invoke(event, *args, **kwargs):
+        try:
+            return invoke(event, *args, **kwargs)
+        except Exception as e:
+            logger.exception("Error handling event %r", event, exc_info=e)
+            return _HANDLER_FAILED
+
+    return safe_invoke
+
+
+def _silent_invoker(invoke: Callable) -> Callable:
+    def silent_invoke(event, *args, **kwargs):
+        try:
+            return invoke(event, *args, **kwargs)
+        except Exception as e:
+            # No traceback formatting on this path; failures are expected
+            # and the caller opted out of paying for logger.exception.
+            logger.debug("Suppressed handler error for %r: %r", event, e)
+            return _HANDLER_FAILED
+
+    return silent_invoke
+
+
+_ERROR_POLICIES = {
+    "log": _logging_invoker,
+    "silent": _silent_invoker,
+    "raise": None,
+}
+
+_MESSAGE_TYPE_NAMES: Dict[type, str] = {}
+_MODEL_HAS_META: Dict[type, bool] = {}
+
+
+class EventResult:
+    """One handler's result for an event.
+
+    Replaces the per-result {"event": ..., "result": ...} dict; keeps
+    subscript access for callers that still index by key.
+    """
+    __slots__ = ("event", "result")
+
+    def __init__(self, event: events.Event, result: Any):
+        self.event = event
+        self.result = result
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "event":
+            return self.event
+        if key == "result":
+            return self.result
+        raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return f"EventResult(event={self.event!r}, result={self.result!r})"
+
+
+class CommandResult:
+    """The handler's result for a command.
+
+    Replaces the per-result {"command": ..., "result": ...} dict; keeps
+    subscript access for callers that still index by key.
+    """
+    __slots__ = ("command", "result")
+
+    def __init__(self, command: commands.Command, result: Any):
+        self.command = command
+        self.result = result
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "command":
+            return self.command
+        if key == "result":
+            return self.result
+        raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return f"CommandResult(command={self.command!r}, result={self.result!r})"
+
+
+def _compile_event_dispatcher(invokers: Tuple) -> Callable:
+    """Unroll the handler loop for one event type into a generated function.
+
+    The result takes (event, context, results, emitted, args, kwargs) and
+    performs exactly the calls the generic loop would, with the per-handler
+    branching resolved at compile time.
+    """
+    namespace = {"_HANDLER_FAILED": _HANDLER_FAILED, "EventResult": EventResult}
+    lines = ["def dispatch(event, context, results, emitted, args, kwargs):"]
+
+    if not invokers:
+        lines.append("    pass")
+
+    for i, (invoke, handler) in enumerate(invokers):
+        namespace[f"invoke_{i}"] = invoke
+        lines.append(f"    result = invoke_{i}(event, context, *args, **kwargs)")
+
+        if handler is not None:
+            namespace[f"handler_{i}"] = handler
+            lines.append("    if result is _HANDLER_FAILED:")
+            lines.append(f"        handler_{i}.drain_emitted()")
+            lines.append("    else:")
+            lines.append(f"        emitted.extend(handler_{i}.drain_emitted())")
+            lines.append("        results.append(EventResult(event, result))")
+        else:
+            lines.append("    if result is not _HANDLER_FAILED:")
+            lines.append("        results.append(EventResult(event, result))")
+
+    exec("\n".join(lines), namespace)
+    return namespace["dispatch"]
+
 
 class MessageBusABC(abc.ABC):
-    context = {}
+    __slots__ = ("_outbox_handlers", "_has_outbox", "context")
 
     def __init__(self) -> None:
-        self._outbox_handlers: List[OutboxHandlerABC] = []
+        self._outbox_handlers: Tuple[OutboxHandlerABC, ...] = ()
+        self._has_outbox = False
+        self.context: dict = {}
 
         super().__init__()
 
@@ -67,60 +187,122 @@ class MessageBusABC(abc.ABC):
     def handle(self, message: Message, *args, **kwargs):
         raise NotImplementedError
 
-    def batch_handle(self, messages: List[Message], *args, **kwargs):
-        for message in messages:
-            self.handle(message, *args, **kwargs)
+    def batch_handle(self, messages: List[Message], *args, **kwargs) -> List:
+        return list(itertools.chain.from_iterable(
+            self.handle(message, *args, **kwargs) for message in messages
+        ))
 
     @classmethod
-    def register_outbox_message(
+    def _build_outbox_row(
         cls,
-        outbox_repo: OutBoxRepoABC,
+        model: Type,
         message: Message,
         meta: Optional[dict] = None
     ) -> Any:
-        if isinstance(message, commands.Command):
+        message_type = type(message)
+
+        if issubclass(message_type, commands.Command):
             type_ = "COMMAND"
-        elif isinstance(message, events.Event):
+        elif issubclass(message_type, events.Event):
             type_ = "EVENT"
         else:
             raise TypeError("Uknown message type")
 
-        model = outbox_repo.get_model()
+        message_type_name = (
+            _MESSAGE_TYPE_NAMES.get(message_type)
+            or _MESSAGE_TYPE_NAMES.setdefault(message_type, message_type.__name__)
+        )
 
         outbox_message = model(
             id=uuid.uuid4(),
             type=type_,
-            message_type=type(message).__name__,
+            message_type=message_type_name,
             message=message,
         )
 
-        if hasattr(model, "meta"):
+        has_meta = _MODEL_HAS_META.get(model)
+
+        if has_meta is None:
+            has_meta = hasattr(model, "meta")
+            _MODEL_HAS_META[model] = has_meta
+
+        if has_meta:
             setattr(outbox_message, "meta", meta)
 
+        return outbox_message
+
+    @classmethod
+    def register_outbox_message(
+        cls,
+        outbox_repo: OutBoxRepoABC,
+        message: Message,
+        meta: Optional[dict] = None
+    ) -> Any:
+        outbox_message = cls._build_outbox_row(outbox_repo.get_model(), message, meta)
+
         outbox_repo.add(outbox_message)
 
         return outbox_message
 
+    @classmethod
+    def register_outbox_messages(
+        cls,
+        outbox_repo: OutBoxRepoABC,
+        messages: List[Message],
+        metas: Optional[List[Optional[dict]]] = None
+    ) -> List[Any]:
+        model = outbox_repo.get_model()
+
+        if metas is None:
+            metas = [None] * len(messages)
+
+        outbox_messages = [
+            cls._build_outbox_row(model, message, meta)
+            for message, meta in zip(messages, metas)
+        ]
+
+        outbox_repo.bulk_add(outbox_messages)
+
+        return outbox_messages
+
     def set_outbox_handlers(self, handlers: List[OutboxHandlerABC]):
-        self._outbox_handlers = handlers
+        self._outbox_handlers = tuple(handlers)
+        self._has_outbox = bool(self._outbox_handlers)
 
-    def process_outbox(self, outbox_repo: OutBoxRepoABC):
-        if len(self._outbox_handlers) == 0:
+    def process_outbox(self, outbox_repo: OutBoxRepoABC, batch_size: int = 100):
+        if not self._has_outbox:
             return
 
         outbox_messages = outbox_repo.list_unprocessed()
+        processed = 0
 
         for outbox_message in outbox_messages:
             for handler in self._outbox_handlers:
                 try:
                     handler.handle(outbox_message, context=self.context)
-                    outbox_repo.save()
                 except Exception as e:
-                    logger.exception(e)
+                    logger.exception("Error processing outbox message %r", outbox_message, exc_info=e)
                     break
 
+            processed += 1
+
+            if processed % batch_size == 0:
+                outbox_repo.save()
+
+        if processed % batch_size != 0:
+            outbox_repo.save()
+
 
 class MessageBus(MessageBusABC):
+    __slots__ = (
+        "_event_handlers",
+        "_command_handlers",
+        "_event_dispatch_cache",
+        "_command_dispatch_cache",
+        "_kind_cache",
+        "_event_error_policy",
+    )
+
     def __init__(
             self,
             event_handlers: Dict[Type[events.Event], List[Union[Callable, EventHandlerABC]]] = None,
@@ -136,22 +318,39 @@ class MessageBus(MessageBusABC):
         else:
             self._command_handlers = dict()
 
-        self.context = {}
+        self._event_dispatch_cache: Dict[type, Tuple] = {}
+        self._command_dispatch_cache: Dict[type, Tuple] = {}
+        self._kind_cache: Dict[type, Tuple[Callable, bool]] = {}
+        self._event_error_policy: Dict[type, str] = {}
 
         super().__init__()
 
     def set_event_handlers(
             self,
             event: Type[events.Event],
-            handlers: List[Union[Callable, EventHandlerABC]]
+            handlers: List[Union[Callable, EventHandlerABC]],
+            safe: bool = True,
+            error_policy: str = None,
     ):
-        self._event_handlers[event] = handlers
+        if error_policy is None:
+            error_policy = "log" if safe else "raise"
+
+        if error_policy not in _ERROR_POLICIES:
+            raise ValueError(f"Unknown error policy: {error_policy}")
+
+        self._event_handlers[event] = tuple(handlers)
+        self._event_error_policy[event] = error_policy
+
+        # Subclasses of this event may have memoized a dispatcher built from
+        # the old registry state; drop everything and re-resolve lazily.
+        self._event_dispatch_cache.clear()
+        self._resolve_event_invokers(event)
 
     def get_event_handlers(
             self,
             event: Type[events.Event],
     ) -> List[Union[Callable, EventHandlerABC]]:
-        return self._event_handlers[event]
+        return list(self._event_handlers.get(event, ()))
 
     def get_command_handler(
             self,
@@ -165,90 +364,181 @@ class MessageBus(MessageBusABC):
             handler: Union[Callable, CommandHandlerABC],
     ):
         self._command_handlers[cmd] = handler
+        self._resolve_command_invoker(cmd)
+
+    def _resolve_event_invokers(self, event_type: Type[events.Event]) -> Optional[Callable]:
+        event_handlers = self._event_handlers
+        handlers: List[Union[Callable, EventHandlerABC]] = []
+        policy = None
+
+        # Walk the MRO so handlers registered for a base event class also
+        # receive subclassed events; the compiled dispatcher is memoized per
+        # concrete type, so the walk happens once per type.
+        for klass in event_type.__mro__:
+            registered = event_handlers.get(klass)
+
+            if registered:
+                handlers.extend(registered)
+
+                if policy is None:
+                    policy = self._event_error_policy.get(klass)
+
+        if not handlers:
+            return None
+
+        wrap = _ERROR_POLICIES[policy or "log"]
+        invokers = []
+
+        for handler in handlers:
+            if isinstance(handler, EventHandlerABC):
+                invoke, drain_handler = handler.handle, handler
+            else:
+                invoke, drain_handler = handler, None
+
+            if wrap is not None:
+                invoke = wrap(invoke)
+
+            invokers.append((invoke, drain_handler))
+
+        dispatch = _compile_event_dispatcher(tuple(invokers))
+        self._event_dispatch_cache[event_type] = dispatch
+        return dispatch
+
+    def _resolve_command_invoker(self, cmd_type: Type[commands.Command]) -> Tuple:
+        handler = self._command_handlers[cmd_type]
+
+        if isinstance(handler, CommandHandlerABC):
+            invoker = (handler.handle, handler)
+        else:
+            invoker = (handler, None)
+
+        self._command_dispatch_cache[cmd_type] = invoker
+        return invoker
+
+    def _classify_message(self, message: Message) -> Tuple[Callable, bool]:
+        marker = getattr(type(message), "kind", None)
+
+        if marker == "event":
+            kind = (self._handle_event, True)
+        elif marker == "command":
+            kind = (self._handle_command, False)
+        else:
+            raise Exception(f"{message} was not an Event or Command type")
+
+        self._kind_cache[type(message)] = kind
+        return kind
 
     def handle(self, message: Message, *args, **kwargs) -> List:
-        results = []
-        queue = [message]
+        kind_cache = self._kind_cache
+
+        fn, is_event = kind_cache.get(type(message)) or self._classify_message(message)
+
+        # Fast path: most messages produce no emissions, so the queue
+        # machinery is only built once a handler actually emits something.
+        pending: List[Message] = []
+
+        if is_event:
+            results = fn(message, pending, *args, **kwargs)
+        else:
+            results = [fn(message, pending, *args, **kwargs)]
+
+        if not pending:
+            return results
+
+        return self._drain_queue(deque(pending), results, *args, **kwargs)
+
+    def batch_handle(self, messages: List[Message], *args, **kwargs) -> List:
+        return self._drain_queue(deque(messages), [], *args, **kwargs)
+
+    def _drain_queue(
+            self,
+            queue: Deque[Message],
+            results: List,
+            *args, **kwargs
+    ) -> List:
+        kind_cache = self._kind_cache
 
         while queue:
-            message = queue.pop(0)
-
-            if isinstance(message, events.Event):
-                events_results = self._handle_event(message, queue, *args, **kwargs)
-                results.extend(events_results)
-            elif isinstance(message, commands.Command):
-                result = self._handle_command(message, queue, *args, **kwargs)
-                results.append(result)
+            message = queue.popleft()
+
+            fn, is_event = kind_cache.get(type(message)) or self._classify_message(message)
+
+            if is_event:
+                results.extend(fn(message, queue, *args, **kwargs))
             else:
-                raise Exception(f"{message} was not an Event or Command type")
+                results.append(fn(message, queue, *args, **kwargs))
 
         return results
 
     def _handle_event(
             self,
             event: events.Event,
-            queue: List[Message],
+            queue: Deque[Message],
             *args, **kwargs
     ) -> List[Any]:
         results = []
+        emitted = []
+        event_type = type(event)
 
-        try:
-            handlers = self._event_handlers[type(event)]
-        except KeyError:
-            logger.error(f"Event handlers for {type(event)} does not exist")
-            return results
+        dispatch = self._event_dispatch_cache.get(event_type)
 
-        for handler in handlers:
-            logger.debug(f"Handling  event {event} with handler {handler}")
+        if dispatch is None:
+            dispatch = self._resolve_event_invokers(event_type)
 
-            try:
-                if issubclass(type(handler), EventHandlerABC):
-                    result = handler.handle(event, context=self.context, *args, **kwargs)
-                    queue.extend(handler.emitted_messages)
-                else:
-                    result = handler(event, context=self.context, *args, **kwargs)
-
-                results.append({
-                    "event": event,
-                    "result": result
-                })
-            except Exception as e:
-                logger.exception(f"Error handling event {event}", exc_info=e)
-                continue
+            if dispatch is None:
+                logger.error("Event handlers for %r does not exist", event_type)
+                return results
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handling event %r", event)
+
+        dispatch(event, self.context, results, emitted, args, kwargs)
+
+        if emitted:
+            queue.extend(emitted)
 
         return results
 
     def _handle_command(
             self,
             cmd: commands.Command,
-            queue: List[Message],
+            queue: Deque[Message],
             *args, **kwargs
     ) -> Any:
-        logger.debug(f"Handling command {cmd}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handling command %r", cmd)
+
+        cmd_type = type(cmd)
 
         try:
-            handler = self._command_handlers[type(cmd)]
+            invoker = self._command_dispatch_cache.get(cmd_type) or self._resolve_command_invoker(cmd_type)
+            invoke, handler = invoker
 
-            if issubclass(type(handler), CommandHandlerABC):
-                result = handler.handle(cmd, context=self.context, *args, **kwargs)
-                queue.extend(handler.emitted_messages)
-            else:
-                result = handler(cmd, context=self.context, *args, **kwargs)
+            result = invoke(cmd, self.context, *args, **kwargs)
+
+            if handler is not None:
+                queue.extend(handler.drain_emitted())
         except Exception as e:
-            logger.exception(f"Error handling command {cmd}", exc_info=e)
+            logger.exception("Error handling command %r", cmd, exc_info=e)
             raise
 
-        return {
-            "command": cmd,
-            "result": result,
-        }
+        return CommandResult(cmd, result)
 
 
 class AsyncMessageBus(MessageBusABC):
+    __slots__ = (
+        "_event_handlers",
+        "_command_handlers",
+        "max_concurrency",
+        "_handler_is_abc",
+        "_resolved_event_handlers",
+    )
+
     def __init__(
             self,
             event_handlers: Dict[Type[events.Event], List[Union[Callable, EventHandlerABC]]] = None,
             command_handlers: Dict[Type[commands.Command], Union[Callable, CommandHandlerABC]] = None,
+            max_concurrency: int = 0,
     ):
         if event_handlers:
             self._event_handlers = event_handlers
@@ -260,7 +550,9 @@ class AsyncMessageBus(MessageBusABC):
         else:
             self._command_handlers = dict()
 
-        self.context = {}
+        self.max_concurrency = max_concurrency
+        self._handler_is_abc: Dict[type, bool] = {}
+        self._resolved_event_handlers: Dict[type, Tuple] = {}
 
         super().__init__()
 
@@ -269,7 +561,8 @@ class AsyncMessageBus(MessageBusABC):
             event: Type[events.Event],
             handlers: List[Union[Callable, EventHandlerABC]]
     ):
-        self._event_handlers[event] = handlers
+        self._event_handlers[event] = tuple(handlers)
+        self._resolved_event_handlers.clear()
 
     def set_command_handler(
             self,
@@ -282,7 +575,7 @@ class AsyncMessageBus(MessageBusABC):
             self,
             event: Type[events.Event],
     ) -> List[Union[Callable, EventHandlerABC]]:
-        return self._event_handlers[event]
+        return list(self._event_handlers.get(event, ()))
 
     def get_command_handler(
             self,
@@ -290,102 +583,275 @@ class AsyncMessageBus(MessageBusABC):
     ) -> CommandHandlerABC:
         return self._command_handlers[command]
 
-    async def process_outbox(self, outbox_repo: OutBoxRepoABC):
-        if len(self._outbox_handlers) == 0:
+    async def process_outbox(
+            self,
+            outbox_repo: OutBoxRepoABC,
+            batch_size: int = 100,
+            ordered: bool = False,
+            concurrency: int = 16,
+    ):
+        if not self._has_outbox:
             return
 
         outbox_messages = await outbox_repo.list_unprocessed()
 
-        for outbox_message in outbox_messages:
-            for handler in self._outbox_handlers:
-                try:
-                    await handler.handle(outbox_message, context=self.context)
+        if ordered:
+            processed = 0
+
+            for outbox_message in outbox_messages:
+                for handler in self._outbox_handlers:
+                    try:
+                        await handler.handle(outbox_message, context=self.context)
+                    except Exception as e:
+                        logger.exception("Error processing outbox message %r", outbox_message, exc_info=e)
+                        break
+
+                processed += 1
+
+                if processed % batch_size == 0:
                     await outbox_repo.save()
-                except Exception as e:
-                    logger.exception(e)
-                    break
 
-    async def batch_handle(self, messages: List[Message], *args, **kwargs):
-        for message in messages:
-            await self.handle(message, *kwargs, **kwargs)
+            if processed % batch_size != 0:
+                await outbox_repo.save()
+
+            return
+
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def process_one(outbox_message):
+            if semaphore is None:
+                await self._process_outbox_message(outbox_message)
+            else:
+                async with semaphore:
+                    await self._process_outbox_message(outbox_message)
+
+        # One save per chunk keeps the ordered path's batched-save behavior
+        # while messages inside a chunk are processed concurrently.
+        for start in range(0, len(outbox_messages), batch_size):
+            chunk = outbox_messages[start:start + batch_size]
+
+            await asyncio.gather(*(process_one(outbox_message) for outbox_message in chunk))
+
+            await outbox_repo.save()
+
+    async def _process_outbox_message(self, outbox_message: Any):
+        results = await asyncio.gather(
+            *(
+                handler.handle(outbox_message, context=self.context)
+                for handler in self._outbox_handlers
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.exception(
+                    "Error processing outbox message %r", outbox_message, exc_info=result,
+                )
+
+    async def batch_handle(self, messages: List[Message], *args, **kwargs) -> List:
+        if self.max_concurrency:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def run(message: Message):
+                async with semaphore:
+                    return await self.handle(message, *args, **kwargs)
+
+            coroutines = (run(message) for message in messages)
+        else:
+            coroutines = (self.handle(message, *args, **kwargs) for message in messages)
+
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+
+        batch_results = []
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.exception("Error handling message in batch", exc_info=result)
+                continue
+
+            batch_results.extend(result)
+
+        return batch_results
 
     async def handle(self, message: Message, *args, **kwargs) -> List:
         results = []
-        queue = [message]
+        queue = deque((message,))
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
 
-        while queue:
-            message = queue.pop(0)
-
-            if isinstance(message, events.Event):
-                events_results = await self._handle_event(message, queue, *args, **kwargs)
-                results.extend(events_results)
-            elif isinstance(message, commands.Command):
-                result = self._handle_command(message, queue, *args, **kwargs)
-                results.append(result)
-            else:
-                raise Exception(f"{message} was not an Event or Command type")
+        try:
+            while queue:
+                marker = getattr(type(queue[0]), "kind", None)
+
+                if marker == "event":
+                    wave = []
+
+                    while queue and getattr(type(queue[0]), "kind", None) == "event":
+                        wave.append(queue.popleft())
+
+                    wave_results = await self._handle_event_wave(wave, queue, semaphore, *args, **kwargs)
+
+                    for event_results in wave_results:
+                        results.extend(event_results)
+                elif marker == "command":
+                    message = queue.popleft()
+                    result = await self._handle_command(message, queue, *args, **kwargs)
+                    results.append(result)
+                else:
+                    message = queue.popleft()
+                    raise Exception(f"{message} was not an Event or Command type")
+        finally:
+            await self._cleanup_context()
 
         return results
 
+    async def _cleanup_context(self):
+        """Hook invoked once after the dispatch queue drains.
+
+        No-op by default: the bus does not own the resources callers put in
+        self.context. Subclasses that stash per-handle resources there (a db
+        session, an http client) can override this to release them; handlers
+        that need per-event cleanup override EventHandlerABC._after_handle
+        instead.
+        """
+        pass
+
+    async def _handle_event_wave(
+            self,
+            wave: List[events.Event],
+            queue: Deque[Message],
+            semaphore: Optional[asyncio.Semaphore],
+            *args, **kwargs
+    ) -> List[Tuple[Any]]:
+        if semaphore is None or len(wave) == 1:
+            return await asyncio.gather(
+                *(self._handle_event(event, queue, *args, **kwargs) for event in wave)
+            )
+
+        async def bounded_handle(event: events.Event):
+            async with semaphore:
+                return await self._handle_event(event, queue, *args, **kwargs)
+
+        return await asyncio.gather(*(bounded_handle(event) for event in wave))
+
+    def _resolve_event_handlers(self, event_type: Type[events.Event]) -> Optional[Tuple]:
+        collected: List[Union[Callable, EventHandlerABC]] = []
+
+        # Walk the MRO so handlers registered for a base event class also
+        # receive subclassed events; the result is memoized per concrete type.
+        for klass in event_type.__mro__:
+            registered = self._event_handlers.get(klass)
+
+            if registered:
+                collected.extend(registered)
+
+        if not collected:
+            return None
+
+        resolved = tuple(collected)
+        self._resolved_event_handlers[event_type] = resolved
+        return resolved
+
     async def _handle_event(
             self,
             event: events.Event,
-            queue: List[Message],
+            queue: Deque[Message],
             *args, **kwargs
     ) -> Tuple[Any]:
-        coroutines = []
+        tasks = []
+        abc_handlers = []
+        event_type = type(event)
 
-        try:
-            handlers = self._event_handlers[type(event)]
-        except KeyError:
-            logger.error(f"Event handlers for {type(event)} does not exist")
-            return tuple()
+        handlers = self._resolved_event_handlers.get(event_type)
+
+        if handlers is None:
+            handlers = self._resolve_event_handlers(event_type)
+
+            if handlers is None:
+                logger.error("Event handlers for %r does not exist", event_type)
+                return tuple()
+
+        handler_is_abc = self._handler_is_abc
+        context = self.context
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for handler in handlers:
-            logger.debug(f"Handling event {event} with handler {handler}")
+            if debug_enabled:
+                logger.debug("Handling event %r with handler %r", event, handler)
+
+            handler_type = type(handler)
+            is_abc = handler_is_abc.get(handler_type)
+
+            if is_abc is None:
+                is_abc = isinstance(handler, EventHandlerABC)
+                handler_is_abc[handler_type] = is_abc
+
+            # No try/except here: it could only ever catch the synchronous
+            # coroutine-creation call, while execution errors surface through
+            # the gather(return_exceptions=True) below.
+            if is_abc:
+                # create_task lets the loop start the handler right away
+                # instead of waiting for the gather below.
+                tasks.append(asyncio.create_task(handler.handle(event, context, *args, **kwargs)))
+                abc_handlers.append(handler)
+            else:
+                tasks.append(asyncio.create_task(handler(event, context, *args, **kwargs)))
 
-            try:
-                if issubclass(type(handler), EventHandlerABC):
-                    coroutine = handler.handle(event, context=self.context, *args, **kwargs)
-                    coroutines.append(coroutine)
-                    queue.extend(handler.emitted_messages)
-                else:
-                    coroutine = handler(event, context=self.context, *args, **kwargs)
-                    coroutines.append(coroutine)
+        gathered = await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as e:
-                logger.exception(f"Error handling event {event}", exc_info=e)
-                continue
+        # Drain only after the gather: the handlers have run by now, so their
+        # emissions are dispatched within this handle() call instead of
+        # leaking into a later one.
+        for handler in abc_handlers:
+            queue.extend(handler.drain_emitted())
 
-        try:
-            results = tuple(await asyncio.gather(*coroutines))
-        except Exception as e:
-            logger.exception("Error handling events", exc_info=e)
-            return tuple()
+        results = []
+
+        for result in gathered:
+            if isinstance(result, Exception):
+                logger.exception("Error handling event %r", event, exc_info=result)
+                continue
 
-        if "db_session" in self.context:
-            self.context["db_session"].close()
+            results.append(result)
 
-        return results
+        return tuple(results)
 
-    def _handle_command(
+    async def _handle_command(
             self,
             cmd: commands.Command,
-            queue: List[Message],
+            queue: Deque[Message],
             *args, **kwargs
     ) -> Any:
-        logger.debug(f"Handling command {cmd}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handling command %r", cmd)
+
+        cmd_type = type(cmd)
+        handler = self._command_handlers.get(cmd_type)
+
+        if handler is None:
+            raise KeyError(f"Command handler for {cmd_type!r} does not exist")
 
         try:
-            handler = self._command_handlers[type(cmd)]
+            handler_type = type(handler)
+            is_abc = self._handler_is_abc.get(handler_type)
+
+            if is_abc is None:
+                is_abc = isinstance(handler, CommandHandlerABC)
+                self._handler_is_abc[handler_type] = is_abc
 
-            if issubclass(type(handler), CommandHandlerABC):
-                result = handler.handle(cmd, context=self.context, *args, **kwargs)
-                queue.extend(handler.emitted_messages)
+            if is_abc:
+                result = handler.handle(cmd, self.context, *args, **kwargs)
             else:
-                result = handler(cmd, context=self.context, *args, **kwargs)
+                result = handler(cmd, self.context, *args, **kwargs)
+
+            # Sync handlers are still supported; only await what needs it.
+            if inspect.isawaitable(result):
+                result = await result
+
+            if is_abc:
+                queue.extend(handler.drain_emitted())
         except Exception as e:
-            logger.exception(f"Error handling command {cmd}", exc_info=e)
+            logger.exception("Error handling command %r", cmd, exc_info=e)
             raise
 
         return result
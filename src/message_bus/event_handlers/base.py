@@ -5,8 +5,11 @@ from typing import List
 
 
 class EventHandlerABC(abc.ABC):
+    __slots__ = ("_emitted_messages", "_spare_emitted")
+
     def __init__(self):
         self._emitted_messages = []
+        self._spare_emitted = []
 
     @abc.abstractmethod
     def _handle(self, event: events.Event, context: dict, *args, **kwargs):
@@ -15,7 +18,7 @@ class EventHandlerABC(abc.ABC):
     def handle(self, event: events.Event, context: dict, *args, **kwargs):
         self._before_handle(context)
         try:
-            self._handle(event, context=context, *args, **kwargs)
+            self._handle(event, context, *args, **kwargs)
         finally:
             self._after_handle(context)
 
@@ -31,3 +34,15 @@ class EventHandlerABC(abc.ABC):
     @property
     def emitted_messages(self) -> List[Message]:
         return self._emitted_messages
+
+    def drain_emitted(self) -> List[Message]:
+        # Double-buffer swap: the drained list is recycled on the next drain,
+        # so steady-state dispatch allocates no new lists. The returned list
+        # is only valid until then, which is fine for the bus that consumes
+        # it immediately.
+        emitted = self._emitted_messages
+        spare = self._spare_emitted
+        spare.clear()
+        self._emitted_messages = spare
+        self._spare_emitted = emitted
+        return emitted
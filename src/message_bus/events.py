@@ -2,4 +2,6 @@ from message_bus.types import Message
 
 
 class Event(Message):
-    pass
+    __slots__ = ()
+
+    kind = "event"
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+
+from typing import Optional
+
+from message_bus.core import MessageBusABC
+from message_bus.repositories.outbox import OutBoxRepoABC
+from message_bus.types import Message
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AsyncOutboxBatcher:
+    """Coalesces outbox registrations from concurrent producers into bulk writes.
+
+    Producers call enqueue() and await the returned future for their outbox
+    row. A background task drains up to max_batch_size items, or whatever
+    arrived within max_queue_time of the first one, and writes them with a
+    single OutBoxRepoABC.bulk_add call.
+
+    start() and enqueue() must be called from within a running event loop;
+    calling them without one raises RuntimeError instead of silently
+    scheduling work on a loop that never runs.
+    """
+
+    def __init__(
+            self,
+            outbox_repo: OutBoxRepoABC,
+            max_batch_size: int = 100,
+            max_queue_time: float = 0.005,
+    ):
+        self._outbox_repo = outbox_repo
+        self._max_batch_size = max_batch_size
+        self._max_queue_time = max_queue_time
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, force: bool = False):
+        if self._task is None:
+            return
+
+        if force:
+            self._task.cancel()
+        else:
+            self._queue.put_nowait(_STOP)
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def __aenter__(self) -> "AsyncOutboxBatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def enqueue(self, message: Message, meta: Optional[dict] = None) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, meta, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self._max_queue_time
+
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+
+                if timeout <= 0:
+                    break
+
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+                if item is _STOP:
+                    stopping = True
+                    break
+
+                batch.append(item)
+
+            self._flush(batch)
+
+    def _flush(self, batch):
+        model = self._outbox_repo.get_model()
+
+        try:
+            rows = [
+                MessageBusABC._build_outbox_row(model, message, meta)
+                for message, meta, _ in batch
+            ]
+            self._outbox_repo.bulk_add(rows)
+        except Exception as e:
+            logger.exception("Error flushing outbox batch", exc_info=e)
+
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for (_, _, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
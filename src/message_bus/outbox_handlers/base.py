@@ -2,6 +2,8 @@ import abc
 
 
 class OutboxHandlerABC(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def _handle(self, outbox_message, context: dict, *args, **kwargs):
         pass
@@ -1,7 +1,12 @@
 import abc
+from weakref import WeakSet
 from typing import List, Type, Any
 from message_bus.types import Message
 
+# Model classes whose rows already passed the field checks in add(); the
+# probes run once per class instead of once per row.
+_VALIDATED_MODELS: WeakSet = WeakSet()
+
 
 class OutBoxRepoABC(abc.ABC):
     @abc.abstractmethod
@@ -9,13 +14,28 @@ class OutBoxRepoABC(abc.ABC):
         raise NotImplementedError
 
     def add(self, outbox_message):
-        assert hasattr(outbox_message, "id")
-        assert hasattr(outbox_message, "type")
-        assert hasattr(outbox_message, "message_type")
-        assert hasattr(outbox_message, "message") and isinstance(getattr(outbox_message, "message"), Message)
+        model = type(outbox_message)
+
+        if model not in _VALIDATED_MODELS:
+            assert hasattr(outbox_message, "id")
+            assert hasattr(outbox_message, "type")
+            assert hasattr(outbox_message, "message_type")
+            assert hasattr(outbox_message, "message") and isinstance(getattr(outbox_message, "message"), Message)
+
+            _VALIDATED_MODELS.add(model)
 
         self._add(outbox_message)
 
+    def bulk_add(self, outbox_messages: List):
+        """Add many outbox rows at once.
+
+        The default implementation falls back to add() per row; repositories
+        backed by an ORM should override it with a real bulk insert
+        (e.g. session.add_all).
+        """
+        for outbox_message in outbox_messages:
+            self.add(outbox_message)
+
     @abc.abstractmethod
     def _add(self, outbox_message):
         raise NotImplementedError
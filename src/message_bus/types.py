@@ -1,16 +1,58 @@
+import json
 import uuid
+import datetime as dt
 from dataclasses_serialization.json import JSONSerializer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 serializer = JSONSerializer
-serializer.serialization_functions[uuid.UUID] = lambda uuid_: str(uuid_)
-serializer.deserialization_functions[uuid.UUID] = lambda _, uuid_: uuid.UUID(uuid_)
+
+
+def _json_default(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# JSONSerializer's dispatch dicts are shared globals; register the UUID and
+# datetime hooks only once even if this module is imported under several
+# names. Checked via a marker attribute because the serializer's refinement
+# dicts don't support cheap membership tests. The datetime/date hooks keep
+# serialize() -- and with it the serialize_json() fallback -- accepting the
+# same field types orjson handles natively.
+if not getattr(serializer, "_message_bus_hooks_registered", False):
+    serializer.serialization_functions[uuid.UUID] = lambda uuid_: str(uuid_)
+    serializer.deserialization_functions[uuid.UUID] = lambda _, uuid_: uuid.UUID(uuid_)
+    serializer.serialization_functions[dt.datetime] = lambda value: value.isoformat()
+    serializer.deserialization_functions[dt.datetime] = lambda _, value: dt.datetime.fromisoformat(value)
+    serializer.serialization_functions[dt.date] = lambda value: value.isoformat()
+    serializer.deserialization_functions[dt.date] = lambda _, value: dt.date.fromisoformat(value)
+    serializer._message_bus_hooks_registered = True
 
 
 class Message:
+    __slots__ = ()
+
     def serialize(self) -> dict:
         return serializer.serialize(self)
 
+    def serialize_json(self) -> bytes:
+        """Serialize straight to JSON bytes.
+
+        With orjson installed, dataclass messages are encoded at C level
+        without the reflection pass serialize() pays for; otherwise this
+        falls back to serialize() plus the stdlib json encoder.
+        """
+        if orjson is not None:
+            return orjson.dumps(self, default=_json_default)
+
+        return json.dumps(self.serialize(), default=_json_default).encode()
+
     @classmethod
     def deserialize(cls, data: dict) -> 'Message':
         return serializer.deserialize(cls, data)
@@ -10,3 +10,192 @@ def test_message_default_fields():
     event = TestEvent(payload="test")
     assert event.payload == "test"
     assert event.serialize() == {"payload": "test"}
+
+
+def test_serialize_json_fallback_handles_datetime(monkeypatch):
+    import datetime as dt
+    import json
+    import message_bus.types as types
+    from message_bus.events import Event as BusEvent
+
+    @dataclass
+    class StampedEvent(BusEvent):
+        created: dt.datetime
+        day: dt.date
+
+    monkeypatch.setattr(types, "orjson", None)
+
+    event = StampedEvent(created=dt.datetime(2020, 1, 2, 3, 4, 5), day=dt.date(2020, 1, 2))
+    payload = json.loads(event.serialize_json())
+    assert payload == {"created": "2020-01-02T03:04:05", "day": "2020-01-02"}
+    assert event.serialize() == payload
+
+
+def test_event_dispatch_cache_invalidation():
+    from message_bus import MessageBus
+    from message_bus.events import Event as BusEvent
+
+    @dataclass
+    class TestEvent(BusEvent):
+        payload: str
+
+    message_bus = MessageBus()
+    message_bus.set_event_handlers(TestEvent, [lambda e, context: "first"])
+
+    results = message_bus.handle(TestEvent(payload="test"))
+    assert results[0]["result"] == "first"
+
+    message_bus.set_event_handlers(TestEvent, [lambda e, context: "second"])
+
+    results = message_bus.handle(TestEvent(payload="test"))
+    assert results[0]["result"] == "second"
+
+
+def test_emitted_messages_drained_between_dispatches():
+    from message_bus import MessageBus
+    from message_bus.events import Event as BusEvent
+    from message_bus.event_handlers.base import EventHandlerABC
+
+    @dataclass
+    class FirstEvent(BusEvent):
+        pass
+
+    @dataclass
+    class SecondEvent(BusEvent):
+        pass
+
+    second_calls = []
+
+    class FirstHandler(EventHandlerABC):
+        def _handle(self, event, context, *args, **kwargs):
+            self.emmit_message(SecondEvent())
+
+    message_bus = MessageBus()
+    message_bus.set_event_handlers(FirstEvent, [FirstHandler()])
+    message_bus.set_event_handlers(SecondEvent, [lambda e, context: second_calls.append(e)])
+
+    message_bus.handle(FirstEvent())
+    assert len(second_calls) == 1
+
+    message_bus.handle(FirstEvent())
+    assert len(second_calls) == 2
+
+
+def test_async_emitted_messages_dispatched_in_same_handle():
+    import asyncio
+    from message_bus import AsyncMessageBus
+    from message_bus.events import Event as BusEvent
+    from message_bus.event_handlers.base import EventHandlerABC
+
+    @dataclass
+    class FirstEvent(BusEvent):
+        pass
+
+    @dataclass
+    class SecondEvent(BusEvent):
+        pass
+
+    second_calls = []
+
+    class FirstHandler(EventHandlerABC):
+        async def handle(self, event, context, *args, **kwargs):
+            self.emmit_message(SecondEvent())
+
+        def _handle(self, event, context, *args, **kwargs):
+            pass
+
+    async def second_handler(event, context):
+        second_calls.append(event)
+
+    message_bus = AsyncMessageBus()
+    message_bus.set_event_handlers(FirstEvent, [FirstHandler()])
+    message_bus.set_event_handlers(SecondEvent, [second_handler])
+
+    asyncio.run(message_bus.handle(FirstEvent()))
+    assert len(second_calls) == 1
+
+    asyncio.run(message_bus.handle(FirstEvent()))
+    assert len(second_calls) == 2
+
+
+def test_async_command_handler_emissions_dispatched():
+    import asyncio
+    from message_bus import AsyncMessageBus
+    from message_bus.commands import Command as BusCommand
+    from message_bus.events import Event as BusEvent
+    from message_bus.command_handlers.base import CommandHandlerABC
+
+    @dataclass
+    class DoThing(BusCommand):
+        pass
+
+    @dataclass
+    class ThingDone(BusEvent):
+        pass
+
+    done_calls = []
+
+    class DoThingHandler(CommandHandlerABC):
+        async def handle(self, cmd, context, *args, **kwargs):
+            self.emmit_message(ThingDone())
+            return "ok"
+
+    async def on_done(event, context):
+        done_calls.append(event)
+
+    message_bus = AsyncMessageBus()
+    message_bus.set_command_handler(DoThing, DoThingHandler())
+    message_bus.set_event_handlers(ThingDone, [on_done])
+
+    results = asyncio.run(message_bus.handle(DoThing()))
+    assert results[0] == "ok"
+    assert len(done_calls) == 1
+
+    asyncio.run(message_bus.handle(DoThing()))
+    assert len(done_calls) == 2
+
+
+def test_subclassed_event_dispatches_to_base_handlers():
+    from message_bus import MessageBus
+    from message_bus.events import Event as BusEvent
+
+    @dataclass
+    class BaseEvent(BusEvent):
+        pass
+
+    @dataclass
+    class ChildEvent(BaseEvent):
+        pass
+
+    message_bus = MessageBus()
+    message_bus.set_event_handlers(BaseEvent, [lambda e, context: "base"])
+
+    results = message_bus.handle(ChildEvent())
+    assert results[0]["result"] == "base"
+
+    message_bus.set_event_handlers(ChildEvent, [lambda e, context: "child"])
+
+    results = message_bus.handle(ChildEvent())
+    assert [r["result"] for r in results] == ["child", "base"]
+
+
+def test_unsafe_event_handlers_propagate_errors():
+    import pytest
+    from message_bus import MessageBus
+    from message_bus.events import Event as BusEvent
+
+    @dataclass
+    class TestEvent(BusEvent):
+        pass
+
+    def failing_handler(event, context):
+        raise ValueError("boom")
+
+    message_bus = MessageBus()
+
+    message_bus.set_event_handlers(TestEvent, [failing_handler])
+    assert message_bus.handle(TestEvent()) == []
+
+    message_bus.set_event_handlers(TestEvent, [failing_handler], safe=False)
+    with pytest.raises(ValueError):
+        message_bus.handle(TestEvent())